@@ -5,7 +5,9 @@ This app queries the unofficial FPL API to retrieve player and gameweek data. It
 provides two JSON endpoints for price changes and low‑owned differential
 recommendations, and a simple frontend for presenting the information. The FPL
 API requires no authentication and is publicly accessible. Keep in mind that
-access is rate‑limited; consider adding caching in production.
+access is rate‑limited, so upstream responses are cached in-process with
+Flask-Caching and refreshed by a background job, letting requests be served
+from memory without waiting on the FPL API.
 
 Endpoints:
 
@@ -15,9 +17,13 @@ Endpoints:
 
 To run this app:
 
-1. Install dependencies with `pip install flask requests`.
+1. Install dependencies with `pip install -r requirements.txt`.
 2. Run `python fpl_app.py` and open http://localhost:5000 in your browser.
 
+In production serve the app with gunicorn instead of the Flask development
+server, e.g. `gunicorn fpl_app:app` from this directory (worker settings live
+in `gunicorn.conf.py`).
+
 Note: The FPL API is provided by https://fantasy.premierleague.com and
 documentation of endpoints can be found in community articles. The
 `bootstrap-static` endpoint returns overall data, including players with
@@ -25,13 +31,31 @@ fields such as `now_cost`, `cost_change_event`, `selected_by_percent`,
 `form` and `points_per_game`【534315671387406†L61-L99】.
 """
 
+import atexit
+import heapq
 import json
+import math
 import os
-from typing import List, Dict, Any
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
+from typing import List, Dict, Any, Callable, NamedTuple, Optional, Tuple
+
+from datetime import datetime, timezone
 
+import numpy as np
+import orjson
 import requests
-from flask import Flask, jsonify, request, render_template
+from apscheduler.schedulers.background import BackgroundScheduler
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, request, send_from_directory
+from flask_caching import Cache, CachedResponse
+from flask_compress import Compress
 from flask_cors import CORS
+from werkzeug.http import parse_cache_control_header
 
 
 app = Flask(__name__)
@@ -39,19 +63,502 @@ app = Flask(__name__)
 # served from another origin (e.g. localhost:3000) can access these endpoints.
 CORS(app)
 
+# Compress JSON and HTML responses (Brotli when the client supports it, gzip
+# otherwise). Tiny bodies are sent as-is since compressing them saves nothing.
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 500
+Compress(app)
+
+# In-process cache for rendered responses and on-demand upstream fetches. Set
+# CACHE_TYPE=RedisCache (and CACHE_REDIS_URL) to share it between workers;
+# each worker still runs its own background refresh.
+cache = Cache(app, config={
+    "CACHE_TYPE": os.environ.get("CACHE_TYPE", "SimpleCache"),
+    "CACHE_DEFAULT_TIMEOUT": 300,
+    "CACHE_REDIS_URL": os.environ.get("CACHE_REDIS_URL"),
+})
+
 # FPL endpoints
 BOOTSTRAP_STATIC_URL = "https://fantasy.premierleague.com/api/bootstrap-static/"
+FIXTURES_URL = "https://fantasy.premierleague.com/api/fixtures/"
+
+# Shared HTTP session so cache misses reuse pooled keep-alive connections to
+# the FPL API instead of paying a fresh TCP and TLS handshake each time.
+# Transient upstream errors and rate limiting are retried with backoff.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    ),
+))
+
+# Worker pool for issuing independent upstream requests concurrently.
+EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fpl-fetch")
+
+# Validators and parsed data from the last successful response per URL, used
+# for conditional GETs (see `conditional_fetch`).
+UPSTREAM_VALIDATORS: Dict[str, Dict[str, Any]] = {}
+
+# Cache lifetimes (seconds). Bootstrap data carries prices and ownership, which
+# move most around the daily price update (roughly 01:30 UK time), so it is
+# refreshed more aggressively inside that window. Fixtures and teams rarely
+# change within a day.
+BOOTSTRAP_CACHE_TIMEOUT = 300
+PRICE_CHANGE_CACHE_TIMEOUT = 60
+PRICE_CHANGE_WINDOW_UTC_HOURS = range(0, 3)
+FIXTURES_CACHE_TIMEOUT = 600
+# Interval (seconds) between background refreshes of upstream data. Set
+# FPL_REFRESH_INTERVAL=0 to disable the scheduler and fetch on demand only.
+REFRESH_INTERVAL = int(os.environ.get("FPL_REFRESH_INTERVAL", 120))
+# A snapshot older than this (e.g. because refreshes keep failing) is only
+# served if an on-demand fetch fails too. After such a failure, the stale
+# snapshot is served without retrying upstream for FETCH_RETRY_AFTER seconds.
+STALE_SNAPSHOT_AGE = 5 * REFRESH_INTERVAL
+FETCH_RETRY_AFTER = 30
+# Lower bound for cache lifetimes derived from upstream Cache-Control headers.
+UPSTREAM_MIN_CACHE_TIMEOUT = 30
+# Lifetime of rendered JSON responses, both in the server-side view cache and
+# in the Cache-Control header sent to browsers and CDNs. Endpoints in
+# PRICE_ENDPOINTS follow the window-aware `bootstrap_cache_timeout` instead.
+RESPONSE_CACHE_TIMEOUT = 300
+# Cache-Control max-age for the static dashboard page.
+INDEX_CACHE_TIMEOUT = 3600
+# Endpoints whose responses are cached server-side and marked public.
+CACHED_ENDPOINTS = {
+    "price_changes",
+    "differentials",
+    "gameweek_overview",
+    "top_players",
+    "fixtures",
+    "next_fixtures",
+}
+# Endpoints reporting prices and ownership, which must reflect the daily
+# price update quickly.
+PRICE_ENDPOINTS = {"price_changes", "differentials"}
+
+# Bootstrap fields kept after parsing, with defaults for optional ones. The
+# raw payload has dozens of other per-player statistics (plus element_stats,
+# phases, game_settings, ...) that no endpoint reads.
+ELEMENT_FIELDS: Dict[str, Any] = {
+    "id": None,
+    "first_name": None,
+    "second_name": None,
+    "team": None,
+    "element_type": None,
+    "now_cost": None,
+    "cost_change_event": 0,
+    "selected_by_percent": "0.0",
+    "form": "0.0",
+    "points_per_game": "0.0",
+    "total_points": 0,
+}
+EVENT_FIELDS = (
+    "id",
+    "name",
+    "deadline_time",
+    "is_current",
+    "is_next",
+    "average_entry_score",
+    "highest_score",
+    "chip_plays",
+)
+
+
+def parse_deadline(dt_str: Optional[str]) -> Optional[float]:
+    """Convert an ISO 8601 deadline from the FPL API to a POSIX timestamp.
+
+    Returns:
+        Optional[float]: Seconds since the epoch, or None if `dt_str` is
+        empty or malformed.
+    """
+    if not dt_str:
+        return None
+    try:
+        return datetime.fromisoformat(dt_str.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
 
+def compact_element(elem: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a raw bootstrap element to `ELEMENT_FIELDS`.
 
-def fetch_bootstrap_data() -> Dict[str, Any]:
+    The display name is formatted once into `_name`, and ownership, form and
+    points per game are parsed once into the `_own`, `_form` and `_ppg`
+    floats (NaN if malformed), so request handlers never format or convert
+    strings.
+    """
+    compact = {field: elem.get(field, default) for field, default in ELEMENT_FIELDS.items()}
+    compact["_name"] = f"{compact['first_name']} {compact['second_name']}"
+    # An empty ownership is malformed, not 0%, so it never qualifies as a differential
+    compact["_own"] = parse_stat(compact["selected_by_percent"], empty_as_zero=False)
+    compact["_form"] = parse_stat(compact["form"])
+    compact["_ppg"] = parse_stat(compact["points_per_game"])
+    return compact
+
+
+def compact_bootstrap(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a raw bootstrap payload to the fields the endpoints use.
+
+    Args:
+        data (Dict[str, Any]): Parsed bootstrap-static response.
+
+    Returns:
+        Dict[str, Any]: A dict with `elements`, `events` and `teams` lists
+        holding only the fields listed in `ELEMENT_FIELDS` and `EVENT_FIELDS`
+        (and team id and name), plus a columnar `player_table` built from the
+        elements. Events also carry `_deadline_ts`, their deadline as a POSIX
+        timestamp (None if missing or malformed).
+    """
+    elements = [compact_element(elem) for elem in data.get("elements", [])]
+    return {
+        "elements": elements,
+        "player_table": build_player_table(elements),
+        "events": [
+            {
+                **{field: event[field] for field in EVENT_FIELDS if field in event},
+                "_deadline_ts": parse_deadline(event.get("deadline_time")),
+            }
+            for event in data.get("events", [])
+        ],
+        "teams": [
+            {"id": team["id"], "name": team["name"]}
+            for team in data.get("teams", [])
+        ],
+    }
+
+
+def bootstrap_cache_timeout() -> int:
+    """Return the cache lifetime for bootstrap data at the current time."""
+    if datetime.now(timezone.utc).hour in PRICE_CHANGE_WINDOW_UTC_HOURS:
+        return PRICE_CHANGE_CACHE_TIMEOUT
+    return BOOTSTRAP_CACHE_TIMEOUT
+
+
+def upstream_cache_timeout(default: int, max_age: Optional[int]) -> int:
+    """Cap a cache lifetime at the upstream `Cache-Control: max-age`.
+
+    The result never drops below `UPSTREAM_MIN_CACHE_TIMEOUT`, so a very short
+    or zero max-age cannot make us poll the rate-limited API continuously.
+    """
+    if max_age is None:
+        return default
+    return max(UPSTREAM_MIN_CACHE_TIMEOUT, min(default, max_age))
+
+
+def conditional_fetch(url: str, parse: Callable[[bytes], Any]) -> Tuple[Any, Optional[int]]:
+    """GET `url`, honouring the freshness and validators of the last response.
+
+    While the last successful response is still fresh according to its
+    `Cache-Control: max-age`, its parsed data is returned without contacting
+    the FPL API. Otherwise its ETag and Last-Modified validators are sent as
+    `If-None-Match` and `If-Modified-Since`; when the API answers 304 Not
+    Modified, the previously parsed data is returned without downloading or
+    parsing the body again.
+
+    Args:
+        url (str): Upstream URL.
+        parse (Callable[[bytes], Any]): Converts a response body to the
+            value to return and keep for revalidation.
+
+    Returns:
+        Tuple[Any, Optional[int]]: The parsed data and the remaining upstream
+        max-age in seconds, if the API sent one.
+    """
+    previous = UPSTREAM_VALIDATORS.get(url)
+    now = time.time()
+    if previous is not None and previous["expires"] is not None and now < previous["expires"]:
+        return previous["data"], int(previous["expires"] - now)
+    headers = {}
+    if previous is not None:
+        if previous["etag"]:
+            headers["If-None-Match"] = previous["etag"]
+        if previous["last_modified"]:
+            headers["If-Modified-Since"] = previous["last_modified"]
+    resp = SESSION.get(url, headers=headers, timeout=30)
+    max_age = parse_cache_control_header(resp.headers.get("Cache-Control")).max_age
+    if resp.status_code == 304 and previous is not None:
+        data = previous["data"]
+    else:
+        resp.raise_for_status()
+        data = parse(resp.content)
+    UPSTREAM_VALIDATORS[url] = {
+        "etag": resp.headers.get("ETag") or (previous or {}).get("etag"),
+        "last_modified": resp.headers.get("Last-Modified") or (previous or {}).get("last_modified"),
+        "expires": None if max_age is None else now + max_age,
+        "data": data,
+    }
+    return data, max_age
+
+
+def fetch_bootstrap_data() -> Tuple[Dict[str, Any], int]:
     """Fetch the static bootstrap data from FPL.
 
+    The payload is parsed with orjson and reduced by `compact_bootstrap`.
+    Unchanged payloads are revalidated with a conditional GET.
+
     Returns:
-        Dict[str, Any]: Parsed JSON response.
+        Tuple[Dict[str, Any], int]: Compacted bootstrap data and how long it
+        may be cached, given the price-change window and upstream max-age.
+    """
+    data, max_age = conditional_fetch(
+        BOOTSTRAP_STATIC_URL, lambda body: compact_bootstrap(orjson.loads(body)),
+    )
+    return data, upstream_cache_timeout(bootstrap_cache_timeout(), max_age)
+
+
+def fetch_fixtures_data() -> Tuple[List[Dict[str, Any]], int]:
+    """Fetch the full season fixture list from FPL.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], int]: Parsed JSON response and how long
+        it may be cached.
+    """
+    data, max_age = conditional_fetch(FIXTURES_URL, orjson.loads)
+    return data, upstream_cache_timeout(FIXTURES_CACHE_TIMEOUT, max_age)
+
+
+def cached_fetch(key: str, fetch: Callable[[], Tuple[Any, int]]) -> Any:
+    """Return the value cached under `key`, calling `fetch` on a miss.
+
+    `fetch` returns the value together with its cache lifetime, so each
+    result is stored with its own TTL.
     """
-    resp = requests.get(BOOTSTRAP_STATIC_URL, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    data = cache.get(key)
+    if data is None:
+        data, timeout = fetch()
+        cache.set(key, data, timeout=timeout)
+    return data
+
+
+# Latest upstream snapshot published by the background refresh job.
+STATE: Dict[str, Any] = {"bootstrap": None, "fixtures": None, "context": None, "ts": None}
+STATE_LOCK = threading.RLock()
+# Time of the last failed on-demand fetch per STATE key (see `read_snapshot`).
+FETCH_FAILURES: Dict[str, float] = {}
+
+
+def refresh_state() -> None:
+    """Fetch fresh bootstrap and fixture data into `STATE`.
+
+    The gameweek context is derived here as well, so the current event is
+    selected once per refresh.
+
+    Runs on the background scheduler. On failure the previous snapshot is kept
+    so endpoints continue serving the last good data (see `read_snapshot`).
+    """
+    try:
+        # The two upstream calls are independent, so overlap them.
+        bootstrap_future = EXECUTOR.submit(fetch_bootstrap_data)
+        fixtures, _ = fetch_fixtures_data()
+        bootstrap, _ = bootstrap_future.result()
+    except Exception:
+        with STATE_LOCK:
+            ts = STATE["ts"]
+        age = "no snapshot loaded" if ts is None else f"snapshot is {time.time() - ts:.0f}s old"
+        app.logger.exception("Background refresh of FPL data failed (%s)", age)
+        return
+    context = build_context(bootstrap)
+    with STATE_LOCK:
+        STATE.update(bootstrap=bootstrap, fixtures=fixtures, context=context, ts=time.time())
+
+
+def read_snapshot(key: str, fetch: Callable[[], Any]) -> Any:
+    """Return `STATE[key]` from the latest snapshot, or fetch it on demand.
+
+    `fetch` is called when no snapshot is loaded or it is older than
+    `STALE_SNAPSHOT_AGE`. If that fetch fails while a stale snapshot exists,
+    the stale value is served with a warning instead of failing the request,
+    and further fetches are skipped for `FETCH_RETRY_AFTER` seconds so a
+    down FPL API is not hit on every request.
+    """
+    with STATE_LOCK:
+        value, ts = STATE[key], STATE["ts"]
+    now = time.time()
+    if value is not None and now - ts <= STALE_SNAPSHOT_AGE:
+        return value
+    if value is not None and now - FETCH_FAILURES.get(key, 0.0) < FETCH_RETRY_AFTER:
+        return value
+    try:
+        fresh = fetch()
+    except Exception:
+        if value is None:
+            raise
+        FETCH_FAILURES[key] = now
+        app.logger.warning(
+            "Fetching %s failed; serving snapshot that is %.0fs old", key, now - ts, exc_info=True,
+        )
+        return value
+    FETCH_FAILURES.pop(key, None)
+    return fresh
+
+
+def get_bootstrap_data() -> Dict[str, Any]:
+    """Return the latest bootstrap data, fetching on demand if no fresh snapshot is loaded."""
+    return read_snapshot("bootstrap", lambda: cached_fetch("bootstrap_data", fetch_bootstrap_data))
+
+
+def load_fixtures_async() -> "Future[List[Dict[str, Any]]]":
+    """Return a future for the latest fixture list.
+
+    While a fresh snapshot is loaded the future is already resolved, so
+    reading it costs no thread hop. Otherwise the fetch runs on `EXECUTOR`,
+    where it can overlap with resolving the bootstrap data.
+    """
+    with STATE_LOCK:
+        fixtures, ts = STATE["fixtures"], STATE["ts"]
+    if fixtures is None or time.time() - ts > STALE_SNAPSHOT_AGE:
+        return EXECUTOR.submit(
+            read_snapshot, "fixtures", lambda: cached_fetch("fixtures_data", fetch_fixtures_data),
+        )
+    future: "Future[List[Dict[str, Any]]]" = Future()
+    future.set_result(fixtures)
+    return future
+
+
+def start_background_refresh() -> Optional[BackgroundScheduler]:
+    """Start the scheduler that keeps `STATE` up to date.
+
+    The first refresh runs immediately. Returns None if background refresh is
+    disabled via `REFRESH_INTERVAL`.
+    """
+    if REFRESH_INTERVAL <= 0:
+        return None
+    scheduler = BackgroundScheduler(daemon=True)
+    scheduler.add_job(
+        refresh_state,
+        "interval",
+        seconds=REFRESH_INTERVAL,
+        next_run_time=datetime.now(timezone.utc),
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.start()
+    atexit.register(scheduler.shutdown, wait=False)
+    return scheduler
+
+
+def ojsonify(data: Any) -> Any:
+    """Serialise `data` to a JSON response using orjson.
+
+    A drop-in replacement for `flask.jsonify` that encodes in C, which is
+    noticeably faster for the player lists returned by these endpoints.
+    """
+    return app.response_class(orjson.dumps(data), mimetype="application/json")
+
+
+def cacheable_response(rv: Any) -> bool:
+    """Return whether a view's return value may be stored in the view cache.
+
+    Views signal errors by returning a `(body, status)` tuple; those must not
+    be cached so that the next request retries the upstream call.
+    """
+    return not isinstance(rv, tuple)
+
+
+def response_cache_timeout(endpoint: Optional[str]) -> int:
+    """Return how long a response from `endpoint` may be cached."""
+    if endpoint in PRICE_ENDPOINTS:
+        return bootstrap_cache_timeout()
+    return RESPONSE_CACHE_TIMEOUT
+
+
+@app.after_request
+def add_cache_headers(response: Any) -> Any:
+    """Allow browsers and CDNs to cache successful API responses."""
+    if request.endpoint in CACHED_ENDPOINTS and response.status_code == 200:
+        response.cache_control.public = True
+        response.cache_control.max_age = response_cache_timeout(request.endpoint)
+    return response
+
+
+def parse_stat(value: Any, empty_as_zero: bool = True) -> float:
+    """Convert a numeric field serialised as a string by the FPL API to float.
+
+    Malformed values become NaN. Empty values count as 0 unless
+    `empty_as_zero` is False, in which case they are malformed too.
+    """
+    if empty_as_zero:
+        value = value or 0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class PlayerTable(NamedTuple):
+    """Player data stored column-wise as NumPy arrays, one row per element.
+
+    Ownership, form and points per game are NaN where the API value could not
+    be parsed.
+    """
+
+    ids: np.ndarray
+    names: np.ndarray
+    team: np.ndarray
+    position: np.ndarray
+    now_cost: np.ndarray
+    cost_change: np.ndarray
+    ownership: np.ndarray
+    form: np.ndarray
+    points_per_game: np.ndarray
+    total_points: np.ndarray
+
+
+def build_player_table(elements: List[Dict[str, Any]]) -> PlayerTable:
+    """Convert compacted bootstrap elements into a `PlayerTable`.
+
+    Args:
+        elements (List[Dict[str, Any]]): Elements from `compact_bootstrap`.
+
+    Returns:
+        PlayerTable: Columns in the same order as `elements`.
+    """
+    return PlayerTable(
+        ids=np.array([elem["id"] for elem in elements], dtype=np.int32),
+        names=np.array([elem["_name"] for elem in elements], dtype=object),
+        team=np.array([elem["team"] for elem in elements], dtype=np.int16),
+        position=np.array([elem["element_type"] for elem in elements], dtype=np.int8),
+        now_cost=np.array([elem["now_cost"] for elem in elements], dtype=np.int16),
+        cost_change=np.array([elem["cost_change_event"] for elem in elements], dtype=np.int16),
+        # float64 so values round-trip to the same decimals the API sent
+        ownership=np.array([elem["_own"] for elem in elements], dtype=np.float64),
+        form=np.array([elem["_form"] for elem in elements], dtype=np.float64),
+        points_per_game=np.array([elem["_ppg"] for elem in elements], dtype=np.float64),
+        total_points=np.array([elem["total_points"] for elem in elements], dtype=np.int32),
+    )
+
+
+def rank_top(candidates: np.ndarray, limit: int, *keys: np.ndarray) -> np.ndarray:
+    """Return up to `limit` row indices from `candidates`, best first.
+
+    Rows are ordered by each of `keys` descending in turn, then by table
+    order, matching a stable descending sort. Only rows that can reach the
+    top `limit` on the first key are fully sorted.
+
+    Args:
+        candidates (np.ndarray): Row indices eligible for selection.
+        limit (int): Maximum number of rows to return.
+        *keys (np.ndarray): Full-table columns to rank by, most significant
+            first.
+
+    Returns:
+        np.ndarray: Selected row indices.
+    """
+    if limit <= 0 or candidates.size == 0:
+        return candidates[:0]
+    if limit < candidates.size:
+        primary = keys[0][candidates]
+        kth = candidates.size - limit
+        # Keep ties with the limit-th best value so the sort below decides them
+        threshold = np.partition(primary, kth)[kth]
+        candidates = candidates[primary >= threshold]
+    order = np.lexsort([candidates] + [-key[candidates] for key in reversed(keys)])
+    return candidates[order[:limit]]
 
 
 def get_current_event(events: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -63,12 +570,13 @@ def get_current_event(events: List[Dict[str, Any]]) -> Dict[str, Any]:
 
     1. If there is an event with `is_current` true, return it.
     2. Otherwise, if there is an event with `is_next` true, return it.
-    3. Otherwise, pick the first event whose deadline_time is in the
-       future relative to now (i.e. upcoming gameweek).
+    3. Otherwise, pick the first event whose deadline is in the future
+       relative to now (i.e. upcoming gameweek), using the `_deadline_ts`
+       timestamp added by `compact_bootstrap`.
     4. If none of the above apply, return the last event.
 
     Args:
-        events (List[Dict[str, Any]]): List of event objects from the FPL API.
+        events (List[Dict[str, Any]]): Compacted event objects.
 
     Returns:
         Dict[str, Any]: The selected event.
@@ -81,18 +589,12 @@ def get_current_event(events: List[Dict[str, Any]]) -> Dict[str, Any]:
     for event in events:
         if event.get("is_next"):
             return event
-    # 3. first future event by deadline_time
-    from datetime import datetime, timezone
-    now = datetime.now(timezone.utc)
+    # 3. first future event by deadline (precomputed by compact_bootstrap)
+    now_ts = time.time()
     for event in events:
-        dt_str = event.get("deadline_time")
-        if dt_str:
-            try:
-                dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-                if dt > now:
-                    return event
-            except Exception:
-                pass
+        deadline_ts = event.get("_deadline_ts")
+        if deadline_ts is not None and deadline_ts > now_ts:
+            return event
     # 4. fallback: if we've passed the last event (off-season), return the first event
     # This ensures the app shows the opening gameweek of the upcoming season when
     # there is no `is_current`, `is_next` or future `deadline_time` available (e.g. off-season).
@@ -102,7 +604,47 @@ def get_current_event(events: List[Dict[str, Any]]) -> Dict[str, Any]:
     return {}
 
 
+class GameweekContext(NamedTuple):
+    """Values shared by the gameweek and fixture endpoints."""
+
+    current_event: Dict[str, Any]
+    teams_info: Dict[int, str]
+
+
+def build_context(data: Dict[str, Any]) -> GameweekContext:
+    """Derive the current gameweek and team names from bootstrap data.
+
+    Args:
+        data (Dict[str, Any]): Bootstrap payload from the FPL API.
+
+    Returns:
+        GameweekContext: The selected event (empty if the API lists no
+        events) and a mapping of team id to team name.
+    """
+    return GameweekContext(
+        current_event=get_current_event(data.get("events", [])),
+        teams_info={team["id"]: team["name"] for team in data.get("teams", [])},
+    )
+
+
+@cache.memoize(timeout=BOOTSTRAP_CACHE_TIMEOUT)
+def fetch_context() -> GameweekContext:
+    """Build the gameweek context from the cached bootstrap data."""
+    return build_context(cached_fetch("bootstrap_data", fetch_bootstrap_data))
+
+
+def get_context() -> GameweekContext:
+    """Return the gameweek context computed at the last refresh.
+
+    The current event and team mapping are derived once per bootstrap refresh
+    rather than once per request. Falls back to a memoized on-demand build if
+    no fresh snapshot is loaded.
+    """
+    return read_snapshot("context", fetch_context)
+
+
 @app.route("/price_changes")
+@cache.cached(timeout=RESPONSE_CACHE_TIMEOUT, query_string=True, response_filter=cacheable_response)
 def price_changes() -> Any:
     """Return players with price rises or falls during the current gameweek.
 
@@ -117,28 +659,32 @@ def price_changes() -> Any:
         JSON: List of players with price change information.
     """
     limit = int(request.args.get("limit", 20))
-    data = fetch_bootstrap_data()
-    players = []
-    for elem in data["elements"]:
-        change = elem.get("cost_change_event", 0)
-        if change != 0:
-            players.append({
-                "id": elem["id"],
-                "name": f"{elem['first_name']} {elem['second_name']}",
-                "team": elem["team"],
-                "position": elem["element_type"],
-                "now_cost": elem["now_cost"] / 10.0,
-                # Convert change from tenths of a million to millions (e.g. +0.1 or -0.1)
-                "price_change": change / 10.0,
-                "selected_by_percent": float(elem["selected_by_percent"]),
-            })
-    # Sort by absolute price change descending, then by change descending
-    players.sort(key=lambda x: abs(x["price_change"]), reverse=True)
-    top_players = players[:limit]
-    return jsonify(top_players)
+    table = get_bootstrap_data()["player_table"]
+    # Select the largest absolute price changes without sorting every player
+    idx = rank_top(np.flatnonzero(table.cost_change), limit, np.abs(table.cost_change))
+    rows = zip(*(column[idx].tolist() for column in (
+        table.ids, table.names, table.team, table.position,
+        table.now_cost, table.cost_change, table.ownership,
+    )))
+    top_players = [
+        {
+            "id": pid,
+            "name": name,
+            "team": team,
+            "position": position,
+            "now_cost": now_cost / 10.0,
+            # Convert change from tenths of a million to millions (e.g. +0.1 or -0.1)
+            "price_change": change / 10.0,
+            "selected_by_percent": ownership,
+        }
+        for pid, name, team, position, now_cost, change, ownership in rows
+    ]
+    # Store with the window-aware TTL rather than the decorator's default
+    return CachedResponse(ojsonify(top_players), response_cache_timeout(request.endpoint))
 
 
 @app.route("/differentials")
+@cache.cached(timeout=RESPONSE_CACHE_TIMEOUT, query_string=True, response_filter=cacheable_response)
 def differentials() -> Any:
     """Return low‑owned players with high recent form.
 
@@ -157,34 +703,39 @@ def differentials() -> Any:
     """
     limit = int(request.args.get("limit", 20))
     max_own = float(request.args.get("max_ownership", 5.0))
-    data = fetch_bootstrap_data()
-    players = []
-    for elem in data["elements"]:
-        # convert string to float
-        try:
-            ownership = float(elem["selected_by_percent"])
-            form = float(elem.get("form", 0) or 0)
-            points_per_game = float(elem.get("points_per_game", 0) or 0)
-        except ValueError:
-            continue
-        if ownership <= max_own:
-            players.append({
-                "id": elem["id"],
-                "name": f"{elem['first_name']} {elem['second_name']}",
-                "team": elem["team"],
-                "position": elem["element_type"],
-                "now_cost": elem["now_cost"] / 10.0,
-                "ownership": ownership,
-                "form": form,
-                "points_per_game": points_per_game,
-            })
-    # Sort by form then points per game
-    players.sort(key=lambda x: (x["form"], x["points_per_game"]), reverse=True)
-    top_players = players[:limit]
-    return jsonify(top_players)
+    table = get_bootstrap_data()["player_table"]
+    # Rank by form then points per game. NaN ownership never passes the
+    # threshold; players with malformed form or points per game are skipped.
+    eligible = (
+        (table.ownership <= max_own)
+        & ~np.isnan(table.form)
+        & ~np.isnan(table.points_per_game)
+    )
+    candidates = np.flatnonzero(eligible)
+    idx = rank_top(candidates, limit, table.form, table.points_per_game)
+    rows = zip(*(column[idx].tolist() for column in (
+        table.ids, table.names, table.team, table.position,
+        table.now_cost, table.ownership, table.form, table.points_per_game,
+    )))
+    top_players = [
+        {
+            "id": pid,
+            "name": name,
+            "team": team,
+            "position": position,
+            "now_cost": now_cost / 10.0,
+            "ownership": ownership,
+            "form": form,
+            "points_per_game": points_per_game,
+        }
+        for pid, name, team, position, now_cost, ownership, form, points_per_game in rows
+    ]
+    # Store with the window-aware TTL rather than the decorator's default
+    return CachedResponse(ojsonify(top_players), response_cache_timeout(request.endpoint))
 
 
 @app.route("/gameweek_overview")
+@cache.cached(timeout=RESPONSE_CACHE_TIMEOUT, query_string=True, response_filter=cacheable_response)
 def gameweek_overview() -> Any:
     """Return a summary of the current gameweek.
 
@@ -199,11 +750,9 @@ def gameweek_overview() -> Any:
     Returns:
         JSON: Current gameweek overview.
     """
-    data = fetch_bootstrap_data()
-    events = data.get("events", [])
-    if not events:
-        return jsonify({}), 503
-    current = get_current_event(events)
+    current = get_context().current_event
+    if not current:
+        return ojsonify({}), 503
     overview = {
         "id": current.get("id"),
         "name": current.get("name"),
@@ -211,10 +760,11 @@ def gameweek_overview() -> Any:
         "highest_score": current.get("highest_score"),
         "chip_plays": current.get("chip_plays", []),
     }
-    return jsonify(overview)
+    return ojsonify(overview)
 
 
 @app.route("/top_players")
+@cache.cached(timeout=RESPONSE_CACHE_TIMEOUT, query_string=True, response_filter=cacheable_response)
 def top_players() -> Any:
     """Return top players sorted by total points.
 
@@ -227,29 +777,27 @@ def top_players() -> Any:
         selected_by_percent.
     """
     limit = int(request.args.get("limit", 10))
-    data = fetch_bootstrap_data()
+    data = get_bootstrap_data()
     players = data.get("elements", [])
-    # Sort players by total_points descending
-    players_sorted = sorted(players, key=lambda e: e.get("total_points", 0), reverse=True)
+    # Pick the highest scorers first so result dicts are only built for them
+    leaders = heapq.nlargest(limit, players, key=itemgetter("total_points"))
     result = []
-    for elem in players_sorted[:limit]:
-        try:
-            ownership = float(elem["selected_by_percent"])
-        except ValueError:
-            ownership = 0.0
+    for elem in leaders:
+        ownership = elem["_own"]
         result.append({
             "id": elem["id"],
-            "name": f"{elem['first_name']} {elem['second_name']}",
+            "name": elem["_name"],
             "team": elem["team"],
             "position": elem["element_type"],
             "now_cost": elem["now_cost"] / 10.0,
             "total_points": elem.get("total_points", 0),
-            "selected_by_percent": ownership,
+            "selected_by_percent": 0.0 if math.isnan(ownership) else ownership,
         })
-    return jsonify(result)
+    return ojsonify(result)
 
 
 @app.route("/fixtures")
+@cache.cached(timeout=RESPONSE_CACHE_TIMEOUT, query_string=True, response_filter=cacheable_response)
 def fixtures() -> Any:
     """Return upcoming fixtures for the next N gameweeks.
 
@@ -272,64 +820,52 @@ def fixtures() -> Any:
     # offset parameter allows retrieving fixtures starting a number of gameweeks
     # ahead of the current gameweek (0 = next gameweek).
     offset = int(request.args.get("offset", 0))
-    data = fetch_bootstrap_data()
-    events = data.get("events", [])
-    if not events:
-        return jsonify({}), 503
-    current_event = get_current_event(events)
+    # On a cold start, load fixtures while the bootstrap context is resolved
+    fixtures_future = load_fixtures_async()
+    current_event, teams_info = get_context()
+    if not current_event:
+        return ojsonify({}), 503
     current_id = current_event.get("id")
     # Determine the range of gameweeks
     start_gw = current_id + offset
     end_gw = start_gw + count - 1
-    # Map team id to team name
-    teams_info = {team["id"]: team["name"] for team in data.get("teams", [])}
-    # Initialize structure for each team
-    team_data: Dict[int, Dict[int, Any]] = {}
-    for tid in teams_info:
-        team_data[tid] = {gw: None for gw in range(start_gw, end_gw + 1)}
     # Fetch fixtures from FPL API
     try:
-        resp = requests.get("https://fantasy.premierleague.com/api/fixtures/", timeout=30)
-        resp.raise_for_status()
-        fixtures = resp.json()
+        fixtures = fixtures_future.result()
     except Exception as e:
-        # If API call fails, return empty data
-        return jsonify({"gws": [], "data": []})
-    # Filter fixtures for our range
+        # If API call fails, return empty data (uncached, so the next request retries)
+        return ojsonify({"gws": [], "data": []}), 503
+    # Single pass over the fixtures: slot each one into its teams' rows,
+    # indexed by gameweek offset from start_gw. Blank gameweeks stay None.
+    team_fixtures: Dict[int, List[Any]] = defaultdict(lambda: [None] * count)
     for fixture in fixtures:
         gw = fixture.get("event")
         if gw is None or gw < start_gw or gw > end_gw:
             continue
+        slot = gw - start_gw
         home_id = fixture.get("team_h")
         away_id = fixture.get("team_a")
-        # Difficulty values
-        home_diff = fixture.get("team_h_difficulty")
-        away_diff = fixture.get("team_a_difficulty")
-        # Record fixture for home team
-        if home_id in team_data:
-            team_data[home_id][gw] = {
+        if home_id in teams_info:
+            team_fixtures[home_id][slot] = {
                 "opponent": teams_info.get(away_id, ""),
                 "home": True,
-                "difficulty": home_diff,
+                "difficulty": fixture.get("team_h_difficulty"),
             }
-        # Record fixture for away team
-        if away_id in team_data:
-            team_data[away_id][gw] = {
+        if away_id in teams_info:
+            team_fixtures[away_id][slot] = {
                 "opponent": teams_info.get(home_id, ""),
                 "home": False,
-                "difficulty": away_diff,
+                "difficulty": fixture.get("team_a_difficulty"),
             }
-    # Build output list
-    output = []
-    for tid, gw_map in team_data.items():
-        output.append({
-            "team_name": teams_info.get(tid, ""),
-            "fixtures": [gw_map[gw] for gw in range(start_gw, end_gw + 1)],
-        })
-    return jsonify({"gws": list(range(start_gw, end_gw + 1)), "data": output})
+    output = [
+        {"team_name": name, "fixtures": team_fixtures[tid]}
+        for tid, name in teams_info.items()
+    ]
+    return ojsonify({"gws": list(range(start_gw, end_gw + 1)), "data": output})
 
 
 @app.route("/next_fixtures")
+@cache.cached(timeout=RESPONSE_CACHE_TIMEOUT, query_string=True, response_filter=cacheable_response)
 def next_fixtures() -> Any:
     """Return detailed fixtures for the current (next) gameweek.
 
@@ -342,21 +878,17 @@ def next_fixtures() -> Any:
     Returns:
         JSON: List of fixture objects.
     """
-    data = fetch_bootstrap_data()
-    events = data.get("events", [])
-    if not events:
-        return jsonify([]), 503
-    current_event = get_current_event(events)
+    # On a cold start, load fixtures while the bootstrap context is resolved
+    fixtures_future = load_fixtures_async()
+    current_event, teams_info = get_context()
+    if not current_event:
+        return ojsonify([]), 503
     current_id = current_event.get("id")
-    # Map team id to name
-    teams_info = {team["id"]: team["name"] for team in data.get("teams", [])}
     # Fetch all fixtures and filter by current event
     try:
-        resp = requests.get("https://fantasy.premierleague.com/api/fixtures/", timeout=30)
-        resp.raise_for_status()
-        fixtures = resp.json()
+        fixtures = fixtures_future.result()
     except Exception:
-        return jsonify([])
+        return ojsonify([]), 503
     result = []
     for fixture in fixtures:
         gw = fixture.get("event")
@@ -371,7 +903,7 @@ def next_fixtures() -> Any:
             "home_difficulty": fixture.get("team_h_difficulty"),
             "away_difficulty": fixture.get("team_a_difficulty"),
         })
-    return jsonify(result)
+    return ojsonify(result)
 
 
 @app.route("/")
@@ -379,15 +911,27 @@ def index() -> Any:
     """Serve the FPL dashboard front page.
 
     This route serves a React application compiled on the fly via Babel. The
-    template `index.html` includes the React code and loads it directly in
+    static `index.html` page includes the React code and loads it directly in
     the browser using CDN resources. Running `python3 fpl_app.py` will start
     both the API and the client without requiring a separate Node.js build.
+    The page has no server-side templating, so it is sent as a static file
+    with an ETag and may be cached for an hour before revalidating.
     """
-    return render_template("index.html")
+    response = send_from_directory(app.static_folder, "index.html", max_age=INDEX_CACHE_TIMEOUT)
+    response.cache_control.must_revalidate = True
+    # Buffer the small file instead of streaming it, so Flask-Compress uses
+    # COMPRESS_ALGORITHM and re-checks If-None-Match against its suffixed ETag.
+    response.direct_passthrough = False
+    response.make_sequence()
+    return response
+
+
+scheduler = start_background_refresh()
 
 
 if __name__ == "__main__":
     # When running locally the PORT environment variable may not be set. Use 5000
     # as a sane default. Importing os above avoids a NameError here.
     port = int(os.environ.get("PORT", 5000))
-    app.run(host="0.0.0.0", port=port, debug=True)
\ No newline at end of file
+    # The debugger and reloader slow every request; opt in with FLASK_DEBUG=1.
+    app.run(host="0.0.0.0", port=port, debug=os.environ.get("FLASK_DEBUG") == "1")
\ No newline at end of file
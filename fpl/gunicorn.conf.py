@@ -0,0 +1,17 @@
+"""Gunicorn settings for serving the FPL insights app in production.
+
+Start the server from the directory containing `fpl_app.py` with
+`gunicorn fpl_app:app`; this file is picked up automatically.
+
+Requests are answered from an in-memory snapshot, so concurrency comes from
+threads rather than processes. Every worker process runs its own background
+refresh against the rate-limited FPL API, so the worker count stays small
+and does not scale with the host's CPU count.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
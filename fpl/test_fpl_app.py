@@ -0,0 +1,248 @@
+"""Tests for the FPL insights app, run against canned FPL API responses."""
+
+import os
+
+import orjson
+import pytest
+
+# Disable the background scheduler before the app module is imported.
+os.environ["FPL_REFRESH_INTERVAL"] = "0"
+
+import fpl_app  # noqa: E402
+
+
+class FakeResponse:
+    """Minimal stand-in for `requests.Response`."""
+
+    def __init__(self, payload, headers=None, status_code=200):
+        self.status_code = status_code
+        self.headers = dict(headers or {})
+        self.content = b"" if payload is None else orjson.dumps(payload)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise fpl_app.requests.HTTPError(self.status_code)
+
+
+def make_element(pid, **fields):
+    element = {
+        "id": pid,
+        "first_name": "First",
+        "second_name": f"Player{pid}",
+        "team": 1,
+        "element_type": 3,
+        "now_cost": 50,
+        "cost_change_event": 0,
+        "selected_by_percent": "10.0",
+        "form": "1.0",
+        "points_per_game": "1.0",
+        "total_points": 10,
+    }
+    element.update(fields)
+    return element
+
+
+@pytest.fixture
+def upstream():
+    """Payloads served by the fake FPL API; tests may modify them."""
+    return {
+        "bootstrap": {
+            "elements": [make_element(1), make_element(2)],
+            "events": [{"id": 1, "name": "Gameweek 1", "is_current": True}],
+            "teams": [{"id": 1, "name": "Arsenal"}, {"id": 2, "name": "Chelsea"}],
+        },
+        "fixtures": [],
+        "headers": {},
+        "calls": [],
+    }
+
+
+@pytest.fixture
+def client(upstream, monkeypatch):
+    def fake_get(url, headers=None, timeout=None):
+        upstream["calls"].append(url)
+        if url == fpl_app.BOOTSTRAP_STATIC_URL:
+            return FakeResponse(upstream["bootstrap"], upstream["headers"])
+        return FakeResponse(upstream["fixtures"], upstream["headers"])
+
+    monkeypatch.setattr(fpl_app.SESSION, "get", fake_get)
+    # The scheduler is off in tests; give manually refreshed snapshots the
+    # lifetime they would have with the default refresh interval.
+    monkeypatch.setattr(fpl_app, "STALE_SNAPSHOT_AGE", 600)
+    fpl_app.cache.clear()
+    fpl_app.UPSTREAM_VALIDATORS.clear()
+    fpl_app.FETCH_FAILURES.clear()
+    with fpl_app.STATE_LOCK:
+        for key in fpl_app.STATE:
+            fpl_app.STATE[key] = None
+    return fpl_app.app.test_client()
+
+
+def test_differentials_skip_players_with_empty_ownership(client, upstream):
+    upstream["bootstrap"]["elements"] = [
+        make_element(1, selected_by_percent="", form="9.0"),
+        make_element(2, selected_by_percent="2.0", form="3.0"),
+    ]
+    resp = client.get("/differentials")
+    assert resp.status_code == 200
+    assert [player["id"] for player in resp.get_json()] == [2]
+
+
+def test_fixtures_reads_loaded_snapshot_without_executor(client, upstream, monkeypatch):
+    upstream["fixtures"] = [
+        {"event": 1, "team_h": 1, "team_a": 2, "team_h_difficulty": 2, "team_a_difficulty": 4},
+    ]
+    fpl_app.refresh_state()
+
+    def fail_submit(*args, **kwargs):
+        raise AssertionError("warm requests must not use the executor")
+
+    monkeypatch.setattr(fpl_app.EXECUTOR, "submit", fail_submit)
+    resp = client.get("/fixtures?count=1")
+    assert resp.status_code == 200
+    assert resp.get_json()["data"][0] == {
+        "team_name": "Arsenal",
+        "fixtures": [{"opponent": "Chelsea", "home": True, "difficulty": 2}],
+    }
+
+
+def test_stale_snapshot_falls_back_to_fetching(client, upstream):
+    fpl_app.refresh_state()
+    with fpl_app.STATE_LOCK:
+        fpl_app.STATE["ts"] -= fpl_app.STALE_SNAPSHOT_AGE + 1
+    upstream["bootstrap"]["elements"] = [make_element(3, total_points=99)]
+    resp = client.get("/top_players")
+    assert [player["id"] for player in resp.get_json()] == [3]
+
+
+def test_stale_snapshot_is_served_when_upstream_fails(client, upstream, monkeypatch):
+    upstream["fixtures"] = [
+        {"event": 1, "team_h": 1, "team_a": 2, "team_h_difficulty": 2, "team_a_difficulty": 4},
+    ]
+    fpl_app.refresh_state()
+    with fpl_app.STATE_LOCK:
+        fpl_app.STATE["ts"] -= fpl_app.STALE_SNAPSHOT_AGE + 1
+    calls = []
+
+    def failing_get(url, headers=None, timeout=None):
+        calls.append(url)
+        raise fpl_app.requests.ConnectionError("FPL API is down")
+
+    monkeypatch.setattr(fpl_app.SESSION, "get", failing_get)
+    assert [player["id"] for player in client.get("/top_players").get_json()] == [1, 2]
+    assert client.get("/gameweek_overview").get_json()["id"] == 1
+    assert client.get("/next_fixtures").get_json()[0]["home_team"] == "Arsenal"
+    # One failed attempt per snapshot key, then the stale data is served directly
+    attempts = len(calls)
+    assert client.get("/top_players?limit=1").status_code == 200
+    assert len(calls) == attempts
+
+
+def test_not_modified_reuses_parsed_data_and_validators(client, monkeypatch):
+    validators = {"ETag": '"v1"', "Last-Modified": "Sat, 01 Aug 2026 10:00:00 GMT"}
+    sent_headers = []
+
+    def fake_get(url, headers=None, timeout=None):
+        sent_headers.append(dict(headers or {}))
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(None, status_code=304)
+        return FakeResponse({"value": 1}, validators)
+
+    parsed = []
+
+    def parse(body):
+        parsed.append(body)
+        return orjson.loads(body)
+
+    monkeypatch.setattr(fpl_app.SESSION, "get", fake_get)
+    first, _ = fpl_app.conditional_fetch(fpl_app.FIXTURES_URL, parse)
+    second, _ = fpl_app.conditional_fetch(fpl_app.FIXTURES_URL, parse)
+    third, _ = fpl_app.conditional_fetch(fpl_app.FIXTURES_URL, parse)
+
+    assert first == {"value": 1}
+    assert second is first and third is first
+    assert len(parsed) == 1
+    expected = {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Sat, 01 Aug 2026 10:00:00 GMT",
+    }
+    # The 304 carried no validators, so the third request reuses the originals
+    assert sent_headers == [{}, expected, expected]
+
+
+def test_refresh_skips_upstream_while_max_age_is_fresh(client, upstream):
+    upstream["headers"] = {"Cache-Control": "public, max-age=600"}
+    fpl_app.refresh_state()
+    assert len(upstream["calls"]) == 2
+    fpl_app.refresh_state()
+    assert len(upstream["calls"]) == 2
+
+
+@pytest.mark.parametrize("path", ["/price_changes", "/differentials"])
+def test_price_endpoints_use_price_window_timeout(client, monkeypatch, path):
+    monkeypatch.setattr(fpl_app, "bootstrap_cache_timeout", lambda: fpl_app.PRICE_CHANGE_CACHE_TIMEOUT)
+    resp = client.get(path)
+    assert resp.cache_control.max_age == fpl_app.PRICE_CHANGE_CACHE_TIMEOUT
+    assert client.get("/top_players").cache_control.max_age == fpl_app.RESPONSE_CACHE_TIMEOUT
+
+
+@pytest.mark.parametrize("accept_encoding", ["gzip, deflate, br, zstd", "gzip", ""])
+def test_index_revalidates_with_etag(client, accept_encoding):
+    headers = {"Accept-Encoding": accept_encoding}
+    first = client.get("/", headers=headers)
+    assert first.status_code == 200
+    assert first.cache_control.max_age == fpl_app.INDEX_CACHE_TIMEOUT
+    if accept_encoding:
+        assert first.headers["Content-Encoding"] in ("br", "gzip")
+    etag = first.headers["ETag"]
+    second = client.get("/", headers={**headers, "If-None-Match": etag})
+    assert second.status_code == 304
+
+
+def reference_rank(candidates, limit, *keys):
+    """Stable descending sort by `keys`, the ordering `rank_top` must match."""
+    ranked = sorted(candidates, key=lambda i: tuple(key[i] for key in keys), reverse=True)
+    # sorted(reverse=True) keeps equal rows in input order, as a stable sort should
+    return ranked[:max(limit, 0)]
+
+
+def test_rank_top_breaks_ties_across_limit_by_next_key_then_table_order():
+    np = fpl_app.np
+    primary = np.array([5, 7, 5, 5, 9, 5, 1])
+    secondary = np.array([1, 0, 3, 3, 0, 2, 0])
+    candidates = np.arange(primary.size)
+    # Four rows tie on primary=5 across the cut-off after 9 and 7
+    result = fpl_app.rank_top(candidates, 4, primary, secondary).tolist()
+    assert result == [4, 1, 2, 3]
+    assert result == reference_rank(candidates.tolist(), 4, primary, secondary)
+    # Without a secondary key, ties fall back to table order
+    assert fpl_app.rank_top(candidates, 3, primary).tolist() == [4, 1, 0]
+
+
+def test_rank_top_limit_at_or_above_candidate_count():
+    np = fpl_app.np
+    primary = np.array([2, 8, 2, 5])
+    candidates = np.array([0, 2, 3])
+    for limit in (3, 10):
+        assert fpl_app.rank_top(candidates, limit, primary).tolist() == [3, 0, 2]
+
+
+def test_rank_top_non_positive_limit_returns_nothing():
+    np = fpl_app.np
+    primary = np.array([3, 1, 2])
+    for limit in (0, -1):
+        assert fpl_app.rank_top(np.arange(3), limit, primary).size == 0
+    assert fpl_app.rank_top(np.arange(0), 5, primary).size == 0
+
+
+def test_rank_top_matches_stable_sort_on_random_tables():
+    np = fpl_app.np
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        size = int(rng.integers(1, 40))
+        primary = rng.integers(0, 4, size)
+        secondary = rng.integers(0, 3, size)
+        candidates = np.flatnonzero(rng.random(size) < 0.7)
+        limit = int(rng.integers(-1, size + 2))
+        expected = reference_rank(candidates.tolist(), limit, primary, secondary)
+        assert fpl_app.rank_top(candidates, limit, primary, secondary).tolist() == expected